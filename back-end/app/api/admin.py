@@ -23,7 +23,7 @@ class AdminViewSet(viewsets.ViewSet):
     @custom_throttle(rate="30/minutes")
     @action(detail=False, methods=["GET"])
     def config(self, request):
-        admin_config = AdminPanelConfiguration.objects.last()
+        admin_config = AdminPanelConfiguration.cached()
         data = {
             "config": True if admin_config else False,
             "captcha_site_key": admin_config.captcha_site_key if admin_config else None,
@@ -96,11 +96,11 @@ class AdminViewSet(viewsets.ViewSet):
     @get_admin_schema("configuration_patch", method="PATCH")
     @action(detail=False, methods=["GET", "PATCH"], permission_classes=[IsAuthenticated])
     def configuration(self, request):
-        data = request.data.copy()
-        admin_config = AdminPanelConfiguration.objects.last()
         if request.method == "GET":
-            serializer = AminConfigSerializer(admin_config)
+            serializer = AminConfigSerializer(AdminPanelConfiguration.cached())
             return Response(serializer.data, status=200)
+        data = request.data.copy()
+        admin_config = AdminPanelConfiguration.objects.last()
         serializer = AminConfigSerializer(
             data=data,
             instance=admin_config,
@@ -136,7 +136,7 @@ class AdminViewSet(viewsets.ViewSet):
             return Response({"error": ["invalid old password"]}, status=400)
         try:
             request.user.password = make_password(password)
-            request.user.save()
+            request.user.save(update_fields=["password"])
         except Exception as e:
             return Response({"error": [f"error: {e}"]}, status=400)
         return Response(status=202)
@@ -153,14 +153,39 @@ class AdminViewSet(viewsets.ViewSet):
             status = 200
         else:
             data = request.data
-            user, create = User.objects.get_or_create(
-                username=data["username"],
-                password=data["password"],
-                is_staff=False,
-                is_superuser=False,
+            many = isinstance(data, list)
+            staffs = data if many else [data]
+            if not staffs:
+                return Response({"error": ["staff list is empty"]}, status=400)
+            for staff in staffs:
+                if not isinstance(staff, dict) or not all(
+                    isinstance(staff.get(key), str) and staff.get(key)
+                    for key in ("username", "password")
+                ):
+                    return Response(
+                        {"error": ["username and password are required for every staff"]},
+                        status=400,
+                    )
+            usernames = [staff["username"] for staff in staffs]
+            exists = set(
+                User.objects.filter(username__in=usernames).values_list("username", flat=True)
+            )
+            User.objects.bulk_create(
+                [
+                    User(
+                        username=staff["username"],
+                        password=make_password(staff["password"]),
+                        is_staff=False,
+                        is_superuser=False,
+                    )
+                    for staff in staffs
+                    if staff["username"] not in exists
+                ],
+                ignore_conflicts=True,
             )
-            serializer = UserSerializer(user)
-            status = 202 if create else 200
+            users = User.objects.filter(username__in=usernames)
+            serializer = UserSerializer(users if many else users.first(), many=many)
+            status = 202 if len(exists) < len(set(usernames)) else 200
         return Response(serializer.data, status=status)
 
     @get_admin_schema("delete_staff")
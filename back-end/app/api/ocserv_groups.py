@@ -25,7 +25,7 @@ class OcservGroupsViewSet(viewsets.ViewSet):
                 if (ascending := request.GET.get("ascending")) and eval(ascending.title())
                 else "-id"
             )
-        data = pagination(request, groups, OcservGroupSerializer)
+        data = pagination(request, groups, OcservGroupSerializer, include_total=True)
         return Response(data)
 
     @get_ocserv_group_schema("create")
@@ -14,6 +14,9 @@ from ocserv.modules.methods import pagination
 
 user_handler = OcservUserHandler()
 
+# columns rendered by OcservUserSerializer, skips the wide configs/desc of the joined group
+user_list_fields = [field.name for field in OcservUser._meta.concrete_fields] + ["group__name"]
+
 
 class OcservUsersViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
@@ -34,6 +37,8 @@ class OcservUsersViewSet(viewsets.ViewSet):
             ),
             OcservUserSerializer,
             context={"online_users": online_users},
+            include_total=True,
+            only_fields=user_list_fields,
         )
         return Response(data)
 
@@ -183,6 +188,8 @@ class OcservUsersViewSet(viewsets.ViewSet):
             ),
             OcservUserSerializer,
             context={"online_users": online_users},
+            include_total=True,
+            only_fields=user_list_fields,
         )
         data.update({"new_users": new_users})
         return Response(data, status=202)
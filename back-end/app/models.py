@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import models
 
 from rest_framework.exceptions import ValidationError as RestValidationError
@@ -8,6 +9,9 @@ from ocserv.modules.handlers import OcservGroupHandler, OcservUserHandler
 
 
 class AdminPanelConfiguration(models.Model):
+    CACHE_KEY = "admin:config"
+    CACHE_TIMEOUT = 3600
+
     captcha_site_key = models.TextField(null=True, blank=True)
     captcha_secret_key = models.TextField(null=True, blank=True)
     default_traffic = models.PositiveIntegerField(default=10)
@@ -17,6 +21,10 @@ class AdminPanelConfiguration(models.Model):
         verbose_name = "Admin Panel Configuration"
         verbose_name_plural = "Admin Panel Configurations"
 
+    @classmethod
+    def cached(cls):
+        return cache.get_or_set(cls.CACHE_KEY, cls.objects.last, cls.CACHE_TIMEOUT)
+
     def save(self, *args, **kwargs):
         if not self.pk:
             if AdminPanelConfiguration.objects.exists():
@@ -36,6 +44,11 @@ class AdminPanelConfiguration(models.Model):
             self.default_configs = {}
         OcservGroupHandler().update_defaults(self.default_configs)
         super().save(*args, **kwargs)
+        cache.delete(self.CACHE_KEY)
+
+    def delete(self, *args, **kwargs):
+        super().delete(*args, **kwargs)
+        cache.delete(self.CACHE_KEY)
 
 
 class OcservGroup(models.Model):
@@ -100,12 +113,6 @@ class OcservUser(models.Model):
     tx = models.DecimalField(max_digits=14, decimal_places=8, default=0)
     rx = models.DecimalField(max_digits=14, decimal_places=8, default=0)
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.__group = (
-            self.group if hasattr(self, "group") and getattr(self, "group") else None
-        )
-
     class Meta:
         verbose_name = "Ocserv User"
         verbose_name_plural = "Ocserv Users"
@@ -275,38 +275,58 @@ schemas = {
     },
     "staffs_create": {
         "request_body": openapi.Schema(
-            required=["username", "password"],
-            type=openapi.TYPE_OBJECT,
-            properties={
-                "username": openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    description="Staff Username",
-                ),
-                "password": openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    description="Staff Password",
-                ),
-            },
+            type=openapi.TYPE_ARRAY,
+            description="List of staffs for bulk creation, a single staff object is accepted "
+            "as well and is answered with a single object",
+            items=openapi.Schema(
+                required=["username", "password"],
+                type=openapi.TYPE_OBJECT,
+                properties={
+                    "username": openapi.Schema(
+                        type=openapi.TYPE_STRING,
+                        description="Staff Username",
+                    ),
+                    "password": openapi.Schema(
+                        type=openapi.TYPE_STRING,
+                        description="Staff Password",
+                    ),
+                },
+            ),
         ),
         "responses": {
             200: openapi.Response(
-                description="Successful Response",
+                description="Successful Response (all staffs already exist)",
                 examples={
-                    "application/json": {
-                        "id": 0,
-                        "username": "string",
-                        "is_admin": False,
-                    }
+                    "application/json": [
+                        {
+                            "id": 0,
+                            "username": "string",
+                            "is_admin": False,
+                        }
+                    ]
                 },
             ),
-            201: openapi.Response(
-                description="Successful Response",
+            202: openapi.Response(
+                description="Successful Response (at least one staff created)",
+                examples={
+                    "application/json": [
+                        {
+                            "id": 0,
+                            "username": "string",
+                            "is_admin": False,
+                        }
+                    ]
+                },
+            ),
+            400: openapi.Response(
+                description="Bad Request",
                 examples={
                     "application/json": {
-                        "id": 0,
-                        "username": "string",
-                        "is_admin": False,
-                    }
+                        "error": [
+                            "staff list is empty",
+                            "username and password are required for every staff",
+                        ]
+                    },
                 },
             ),
             403: openapi.Response(
@@ -48,10 +48,19 @@ schemas = {
                 description="Group Name filter include",
                 required=False,
             ),
+            openapi.Parameter(
+                name="cursor",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_INTEGER,
+                description="keyset pagination, id of the last group of the previous page "
+                "(empty for the first page), replaces page. rows are ordered by id and the "
+                "response has next_cursor instead of page, pages and total_count",
+                required=False,
+            ),
         ],
         "responses": {
             200: openapi.Response(
-                description="Successful Response",
+                description="Successful Response (next_cursor instead of page in cursor mode)",
                 examples={
                     "application/json": {
                         "result": [
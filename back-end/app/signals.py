@@ -0,0 +1,23 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from ocserv.authentication import invalidate_token
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    # also runs for tokens removed by the cascade of a deleted user
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_token(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_token(Token.objects.filter(user=instance).values_list("key", flat=True).first())
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_user_token(sender, instance, **kwargs):
+    invalidate_token(Token.objects.filter(user=instance).values_list("key", flat=True).first())
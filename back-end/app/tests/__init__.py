@@ -1,9 +1,13 @@
 import os
+from contextlib import contextmanager
+from functools import cached_property
 from unittest import TestCase
 from unittest.mock import patch
 
 from django.conf import settings
 from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIRequestFactory
 
 from app.api.admin import AdminViewSet
@@ -68,7 +72,9 @@ class OcservTestAbstract(TestCase):
                 "password": password,
             },
         )
-        response = AdminViewSet.as_view({"post": "login"})(request)
+        # tests log in far more often than the login rate allows
+        with patch("ocserv.throttles.CustomThrottle.allow_request", return_value=True):
+            response = AdminViewSet.as_view({"post": "login"})(request)
         self.check_status_and_errors(response, status=status)
         if status == 200:
             self.assertEqual(response.data["user"]["username"], username)
@@ -76,13 +82,29 @@ class OcservTestAbstract(TestCase):
             return response.data.get("token")
         return None
 
-    @property
+    @cached_property
     def get_header(self) -> dict:
         token = self.token
         if not token:
             token = self.login()
         return {"Authorization": f"Token {token}"}
 
+    def reset_header(self):
+        """drop the memoized get_header, needed whenever self.token is swapped"""
+        self.__dict__.pop("get_header", None)
+
+    @contextmanager
+    def assertNumQueries(self, num):
+        with CaptureQueriesContext(connection) as context:
+            yield context
+        queries = context.captured_queries
+        self.assertEqual(
+            len(queries),
+            num,
+            f"{len(queries)} queries executed, {num} expected\n"
+            + "\n".join(query["sql"] for query in queries),
+        )
+
     def check_status_and_errors(self, response, status, error_msg=None):
         self.assertEqual(response.status_code, int(status))
         if response.status_code in [400, 403, 404] and error_msg:
@@ -6,6 +6,7 @@ from rest_framework.authtoken.models import Token
 
 from app.api.admin import AdminViewSet
 from app.models import OcservUser
+from ocserv.authentication import invalidate_token
 from app.tests import (
     OcservTestAbstract,
     default_configs,
@@ -21,12 +22,20 @@ class AdminApiTest(OcservTestAbstract):
         super().__init__(*args, **kwargs)
         self.token = None
 
-    def setUp(self) -> None:
-        admin, _ = User.objects.get_or_create(
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.admin, _ = User.objects.get_or_create(
             username=admin_username,
             defaults={"password": make_password(admin_password), "is_superuser": True},
         )
-        self.token, _ = Token.objects.get_or_create(user=admin)
+        for i in range(5):
+            User.objects.get_or_create(username=f"seed_test_staff{i}")
+
+    def setUp(self) -> None:
+        # test_logout deletes the token, so it is ensured for every test
+        self.token, _ = Token.objects.get_or_create(user=self.admin)
+        self.reset_header()
 
     def test_create_admin_config(self):
         data = {
@@ -50,10 +59,34 @@ class AdminApiTest(OcservTestAbstract):
             self.login(status=200)
 
     def test_logout(self):
-        request = self.factory.delete("/admin/logout/", headers=self.get_header)
+        headers = self.get_header
+        request = self.factory.delete("/admin/logout/", headers=headers)
         response = AdminViewSet.as_view({"delete": "logout"})(request)
         self.check_status_and_errors(response, 204)
 
+        # cached token must not authenticate after logout
+        request = self.factory.get("/admin/configuration/", headers=headers)
+        response = AdminViewSet.as_view({"get": "configuration"})(request)
+        self.check_status_and_errors(response, 401)
+
+    def test_cached_token_invalidation(self):
+        staff = User.objects.create_user(username="cached_token_staff", password="1234")
+        headers = {"Authorization": f"Token {Token.objects.create(user=staff).key}"}
+
+        def config_status():
+            request = self.factory.get("/admin/configuration/", headers=headers)
+            return AdminViewSet.as_view({"get": "configuration"})(request).status_code
+
+        self.assertEqual(config_status(), 200)
+        staff.is_active = False
+        staff.save()
+        self.assertEqual(config_status(), 401)
+        staff.is_active = True
+        staff.save()
+        self.assertEqual(config_status(), 200)
+        staff.delete()
+        self.assertEqual(config_status(), 401)
+
     def test_configuration_get(self):
         request = self.factory.get("/admin/configuration/", headers=self.get_header)
         response = AdminViewSet.as_view({"get": "configuration"})(request)
@@ -63,6 +96,14 @@ class AdminApiTest(OcservTestAbstract):
         self.assertEqual(response.data["default_configs"]["ipv4-network"], "172.16.12.1/22")
         self.assertEqual(response.data["default_traffic"], 10)
 
+        # token and admin configs are both cached after the first request, a login in
+        # between must not evict them
+        self.login()
+        request = self.factory.get("/admin/configuration/", headers=self.get_header)
+        with self.assertNumQueries(0):
+            response = AdminViewSet.as_view({"get": "configuration"})(request)
+        self.check_status_and_errors(response, 200)
+
     @patch("ocserv.modules.handlers.OcservGroupHandler.update_defaults")
     def test_configuration_update(self, *args, **kwargs):
         request = self.factory.patch(
@@ -93,7 +134,10 @@ class AdminApiTest(OcservTestAbstract):
             "show_iroutes": {},
         }
         request = self.factory.get("/admin/dashboard/", headers=self.get_header)
-        response = AdminViewSet.as_view({"get": "dashboard"})(request)
+        invalidate_token(self.token.key)
+        # token lookup only
+        with self.assertNumQueries(1):
+            response = AdminViewSet.as_view({"get": "dashboard"})(request)
         self.check_status_and_errors(response, 200)
         self.assertIn("Note", response.data["show_status"], "Note is not present in show_status")
         self.assertEqual(response.data["show_ip_bans"], [])
@@ -109,6 +153,7 @@ class AdminApiTest(OcservTestAbstract):
             is_superuser=False,
         )
         self.token = self.login(staff_username, staff_password)
+        self.reset_header()
         data = {
             "old_password": staff_password,
             "password": "new_test_staff_password",
@@ -117,13 +162,20 @@ class AdminApiTest(OcservTestAbstract):
         response = AdminViewSet.as_view({"post": "change_password"})(request)
         self.check_status_and_errors(response, 202)
         self.token = None
+        self.reset_header()
         user.delete()
 
     def test_staff_list(self):
         request = self.factory.get("/admin/staffs/", headers=self.get_header)
-        response = AdminViewSet.as_view({"get": "staffs"})(request)
+        invalidate_token(self.token.key)
+        # token lookup and staff list, regardless of the number of staffs
+        with self.assertNumQueries(2):
+            response = AdminViewSet.as_view({"get": "staffs"})(request)
         self.check_status_and_errors(response, 200)
         self.assertIsInstance(response.data, list)
+        usernames = [staff["username"] for staff in response.data]
+        for i in range(5):
+            self.assertIn(f"seed_test_staff{i}", usernames)
 
     def test_staff_create(self):
         data = {"username": "setup_test_staff1", "password": "setup_test_staff_passwd"}
@@ -138,12 +190,54 @@ class AdminApiTest(OcservTestAbstract):
         self.check_status_and_errors(response, 200)
         self.assertEqual(response.data.get("username"), "setup_test_staff1")
 
+    def test_staff_bulk_create(self):
+        data = [
+            {"username": "bulk_test_staff1", "password": "bulk_test_staff_passwd"},
+            {"username": "bulk_test_staff2", "password": "bulk_test_staff_passwd"},
+        ]
+        request = self.factory.post(
+            "/admin/staffs/", headers=self.get_header, data=data, format="json"
+        )
+        response = AdminViewSet.as_view({"post": "staffs"})(request)
+        self.check_status_and_errors(response, 202)
+        self.assertEqual(
+            sorted(staff["username"] for staff in response.data),
+            ["bulk_test_staff1", "bulk_test_staff2"],
+        )
+        self.login("bulk_test_staff1", "bulk_test_staff_passwd")
+
+        # recreate same users
+        request = self.factory.post(
+            "/admin/staffs/", headers=self.get_header, data=data, format="json"
+        )
+        response = AdminViewSet.as_view({"post": "staffs"})(request)
+        self.check_status_and_errors(response, 200)
+        self.assertEqual(len(response.data), 2)
+
+    def test_staff_bulk_create_invalid(self):
+        error = "username and password are required for every staff"
+        for data, error_msg in [
+            ([], "staff list is empty"),
+            ([{"password": "bulk_test_staff_passwd"}], error),
+            ([{"username": "bulk_invalid_test_staff"}], error),
+            ([{"username": ["bulk_invalid_test_staff"], "password": "passwd"}], error),
+            (["bulk_invalid_test_staff"], error),
+            ({"username": "bulk_invalid_test_staff"}, error),
+        ]:
+            request = self.factory.post(
+                "/admin/staffs/", headers=self.get_header, data=data, format="json"
+            )
+            response = AdminViewSet.as_view({"post": "staffs"})(request)
+            self.check_status_and_errors(response, 400, error_msg)
+        self.assertFalse(User.objects.filter(username="bulk_invalid_test_staff").exists())
+
     def test_staff_delete(self):
         headers = self.get_header
-        request = self.factory.delete("/admin/staffs/3/", headers=headers)
-        response = AdminViewSet.as_view({"delete": "delete_staff"})(request, pk=3)
+        pk = User.objects.create(username="delete_test_staff").pk
+        request = self.factory.delete(f"/admin/staffs/{pk}/", headers=headers)
+        response = AdminViewSet.as_view({"delete": "delete_staff"})(request, pk=pk)
         self.check_status_and_errors(response, 204)
 
-        request = self.factory.delete("/admin/staffs/30/", headers=headers)
-        response = AdminViewSet.as_view({"delete": "delete_staff"})(request, pk=30)
+        request = self.factory.delete(f"/admin/staffs/{pk}/", headers=headers)
+        response = AdminViewSet.as_view({"delete": "delete_staff"})(request, pk=pk)
         self.check_status_and_errors(response, 404, "Staff not found!")
@@ -5,7 +5,9 @@ from django.contrib.auth.models import User
 
 from app.api.ocserv_groups import OcservGroupsViewSet
 from app.models import OcservGroup
+from app.serializers import OcservGroupSerializer
 from app.tests import OcservTestAbstract
+from ocserv.modules.methods import pagination
 
 
 class OcservGroupApiTest(OcservTestAbstract):
@@ -32,7 +34,10 @@ class OcservGroupApiTest(OcservTestAbstract):
         if staff and not self.staff_token:
             self.staff_token = self.login(self.staff_username, password=self.staff_password)
             return {"Authorization": f"Token {self.staff_token}"}
-        return super().get_header
+        # the parent memoizes get_header under this same name, so keep the admin token here
+        if not self.token:
+            self.token = self.login()
+        return {"Authorization": f"Token {self.token}"}
 
     def group_list(self, staff=False):
         request = self.factory.get("/groups/", headers=self.get_header(staff=staff))
@@ -51,6 +56,63 @@ class OcservGroupApiTest(OcservTestAbstract):
         self.group_list()
         self.group_list(staff=True)
 
+    def test_group_list_cursor(self):
+        request = self.factory.get(
+            "/groups/", data={"cursor": "", "item_per_page": 1}, headers=self.get_header()
+        )
+        response = OcservGroupsViewSet.as_view({"get": "list"})(request)
+        self.check_status_and_errors(response, 200)
+        self.assertEqual(len(response.data.get("result")), 1)
+        next_cursor = response.data.get("next_cursor")
+        self.assertEqual(next_cursor, response.data["result"][0]["id"])
+
+        request = self.factory.get(
+            "/groups/",
+            data={"cursor": next_cursor, "item_per_page": 100},
+            headers=self.get_header(),
+        )
+        # token is cached by the first request, only the page query runs and no count
+        with self.assertNumQueries(1):
+            response = OcservGroupsViewSet.as_view({"get": "list"})(request)
+        self.check_status_and_errors(response, 200)
+        self.assertTrue(all(group["id"] > next_cursor for group in response.data.get("result")))
+        self.assertIsNone(response.data.get("next_cursor"))
+        self.assertNotIn("total_count", response.data)
+        self.assertNotIn("pages", response.data)
+
+    def test_group_list_cursor_evaluated_queryset(self):
+        groups = OcservGroup.objects.order_by("-id")
+        ids = [group.id for group in groups]
+        request = self.factory.get("/groups/", data={"cursor": ids[0], "item_per_page": 1})
+        with self.assertNumQueries(0):
+            data = pagination(request, groups, OcservGroupSerializer, include_total=True)
+        self.assertEqual([group["id"] for group in data["result"]], ids[1:2])
+        self.assertEqual(data["next_cursor"], ids[1])
+
+    def test_group_list_empty(self):
+        request = self.factory.get(
+            "/groups/", data={"name": "not_exists_group", "page": 3}, headers=self.get_header()
+        )
+        response = OcservGroupsViewSet.as_view({"get": "list"})(request)
+        self.check_status_and_errors(response, 200)
+        self.assertIsInstance(response.data, dict)
+        self.assertEqual(response.data.get("result"), [])
+        self.assertEqual(response.data.get("total_count"), 0)
+        self.assertEqual(response.data.get("pages"), 1)
+        self.assertEqual(response.data.get("page"), 1)
+
+    def test_group_list_out_of_range(self):
+        request = self.factory.get(
+            "/groups/", data={"page": 9999, "item_per_page": 1}, headers=self.get_header()
+        )
+        response = OcservGroupsViewSet.as_view({"get": "list"})(request)
+        self.check_status_and_errors(response, 200)
+        pages = response.data.get("pages")
+        self.assertEqual(pages, response.data.get("total_count"))
+        self.assertEqual(response.data.get("page"), pages)
+        last_group = OcservGroup.objects.exclude(name="defaults").order_by("id").last()
+        self.assertEqual([group["id"] for group in response.data["result"]], [last_group.id])
+
     def group_detail(self, staff=False):
         request = self.factory.get("/groups/1/", headers=self.get_header(staff=staff))
         response = OcservGroupsViewSet.as_view({"get": "retrieve"})(request, pk=1)
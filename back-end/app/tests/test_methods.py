@@ -0,0 +1,58 @@
+import json
+from unittest import TestCase
+
+from ocserv.modules.methods import ip_bans_creator, user_key_creator
+
+occtl_user = {
+    "Username": "test_user",
+    "Hostname": "test-host",
+    "Device": "vpns0",
+    "Remote IP": "10.0.0.2",
+    "User-Agent": "OpenConnect",
+    "_Connected at": "10s",
+    "Connected at": "2024-04-14 12:02",
+    "Average RX": "1.0 KB/sec",
+    "Average TX": "2.0 KB/sec",
+}
+api_user = {
+    "username": "test_user",
+    "hostname": "test-host",
+    "device": "vpns0",
+    "remote_ip": "10.0.0.2",
+    "user_agent": "OpenConnect",
+    "since": "10s",
+    "connected_at": "2024-04-14 12:02",
+    "average_rx": "1.0 KB/sec",
+    "average_tx": "2.0 KB/sec",
+}
+
+
+class CreatorsTestCase(TestCase):
+    def test_user_key_creator(self):
+        users = json.dumps([occtl_user])
+        self.assertEqual(list(user_key_creator(users)), [api_user])
+        self.assertEqual(list(user_key_creator(users.encode())), [api_user])
+        self.assertEqual(list(user_key_creator([occtl_user])), [api_user])
+        self.assertEqual(list(user_key_creator("[]")), [])
+
+    def test_user_key_creator_missing_keys(self):
+        users = json.dumps([{"Username": "test_user", "Device": "vpns0"}])
+        expected = dict.fromkeys(api_user)
+        expected.update({"username": "test_user", "device": "vpns0"})
+        self.assertEqual(list(user_key_creator(users)), [expected])
+
+    def test_ip_bans_creator(self):
+        bans = json.dumps(
+            [{"IP": "10.0.0.3", "Since": "2024-04-14 12:02", "Score": 80}, {"IP": "10.0.0.4"}]
+        )
+        self.assertEqual(
+            list(ip_bans_creator(bans)),
+            [
+                {"ip": "10.0.0.3", "since": "2024-04-14 12:02", "score": 80},
+                {"ip": "10.0.0.4", "since": None, "score": None},
+            ],
+        )
+        self.assertEqual(list(ip_bans_creator("[]")), [])
+        self.assertEqual(list(ip_bans_creator("")), [])
+        self.assertEqual(list(ip_bans_creator(None)), [])
+        self.assertEqual(list(ip_bans_creator(bans.encode())), [])
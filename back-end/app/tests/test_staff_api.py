@@ -23,6 +23,7 @@ class StaffApiTest(OcservTestAbstract):
             },
         )
         self.token = self.login(staff_username, staff_password)
+        self.reset_header()
 
     def test_staff_list(self):
         request = self.factory.get("/admin/staffs/", headers=self.get_header)
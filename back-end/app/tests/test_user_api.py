@@ -0,0 +1,35 @@
+from unittest.mock import patch
+
+from app.api.ocserv_users import OcservUsersViewSet
+from app.models import OcservGroup, OcservUser
+from app.tests import OcservTestAbstract
+from ocserv.authentication import invalidate_token
+
+
+class OcservUserApiTest(OcservTestAbstract):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        group = OcservGroup.objects.get(name="defaults")
+        OcservUser.objects.bulk_create(
+            [
+                OcservUser(group=group, username=f"list_test_user{i}", password="1234")
+                for i in range(5)
+            ],
+            ignore_conflicts=True,
+        )
+
+    @patch("ocserv.modules.handlers.OcservUserHandler.online")
+    def test_user_list(self, mock_data_online):
+        mock_data_online.return_value = []
+        headers = self.get_header
+        request = self.factory.get("/users/", headers=headers)
+        invalidate_token(headers["Authorization"].split()[1])
+        # token lookup, count and page, regardless of the number of users
+        with self.assertNumQueries(3):
+            response = OcservUsersViewSet.as_view({"get": "list"})(request)
+        self.check_status_and_errors(response, 200)
+        usernames = [user["username"] for user in response.data["result"]]
+        for i in range(5):
+            self.assertIn(f"list_test_user{i}", usernames)
+        self.assertTrue(all(user["group_name"] == "defaults" for user in response.data["result"]))
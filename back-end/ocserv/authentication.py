@@ -0,0 +1,37 @@
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+TOKEN_CACHE_TIMEOUT = 300
+
+
+def token_cache_key(key):
+    return f"tok:{key}"
+
+
+def invalidate_token(key):
+    if key:
+        cache.delete(token_cache_key(key))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that keeps resolved tokens (with their user) in the cache,
+    so an authenticated request does not hit the authtoken table every time.
+    Cached entries must be invalidated when a token is deleted or its user is changed.
+    """
+
+    def authenticate_credentials(self, key):
+        model = self.get_model()
+        cache_key = token_cache_key(key)
+        token = cache.get(cache_key)
+        if token is None:
+            try:
+                token = model.objects.select_related("user").get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_("Invalid token."))
+            cache.set(cache_key, token, TOKEN_CACHE_TIMEOUT)
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+        return token.user, token
@@ -1,4 +1,3 @@
-from django.core.cache import cache
 from django.utils.decorators import method_decorator
 from rest_framework.response import Response
 
@@ -11,13 +10,9 @@ from app.models import AdminPanelConfiguration
 def check_recaptcha(view_func):
     @wraps(view_func)
     def _wrapper(request, *args, **kwargs):
-        cache.clear()
-        config = cache.get("admin_config")
+        config = AdminPanelConfiguration.cached()
         if not config:
-            config = AdminPanelConfiguration.objects.last()
-            if not config:
-                return Response(status=400)
-            cache.set("admin_config", config)
+            return Response(status=400)
         if config.captcha_secret_key:
             data = {"secret": config.captcha_secret_key, "response": request.data.get("token")}
             response = requests.post(
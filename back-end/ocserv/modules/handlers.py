@@ -1,4 +1,3 @@
-import json
 import os
 import subprocess
 
@@ -255,9 +254,8 @@ class OcservUserHandler:
                 stdout=subprocess.PIPE,
             )
             _users, err = p.communicate()
-            if _users and len(_users.decode("utf-8")) > 0:
-                _users = json.loads(_users)
-                users = user_key_creator(_users)
+            if _users:
+                users = list(user_key_creator(_users))
         except FileNotFoundError as e:
             logger.log(level="critical", message=f"online users error ({e})")
         return users
@@ -335,15 +333,19 @@ class OcctlHandler:
         else:
             result = {action.replace(" ", "_"): self.output(action)}
         if "show_users" in result or "show_user" in result:
-            result["show_users"] = user_key_creator(
-                result["show_users"] if "show_users" in result else result["show_user"]
+            result["show_users"] = list(
+                user_key_creator(
+                    result["show_users"] if "show_users" in result else result["show_user"]
+                )
             )
             result.pop("show_user", None)
         if "show_ip_bans" in result or "show_ip_ban_points" in result:
-            result["show_ip_bans"] = ip_bans_creator(
-                result["show_ip_bans"]
-                if "show_ip_bans" in result
-                else result["show_ip_ban_points"]
+            result["show_ip_bans"] = list(
+                ip_bans_creator(
+                    result["show_ip_bans"]
+                    if "show_ip_bans" in result
+                    else result["show_ip_ban_points"]
+                )
             )
             result.pop("show_ip_ban_points", None)
         return result
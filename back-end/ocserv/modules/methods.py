@@ -1,68 +1,81 @@
-import json
+from math import ceil
 
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger, InvalidPage
+from ocserv.modules._creators import ip_bans_creator, user_key_creator
 
 
-def pagination(request, queryset, serializer, context=None):
-    if context is None:
-        context = {}
-    query_count = queryset.count()
-    page = int(request.GET.get("page", 1))
-    if query_count == 0:
-        return {"result": [], "pages": 1, "page": int(page if str(page).isnumeric() else 1)}
-    item_per_page = request.GET.get("item_per_page")
-    item_per_page = 100 if not str(item_per_page).isnumeric() else item_per_page
-    if query_count < int(item_per_page):
-        item_per_page = query_count
-    if not queryset.ordered:
-        queryset = queryset.order_by("id")
-    paginator = Paginator(queryset, item_per_page)
+def _positive_int(value, default):
     try:
-        obj = paginator.page(page).object_list
-    except ZeroDivisionError:
-        return queryset.none(), 0
-    except (EmptyPage, PageNotAnInteger, InvalidPage):
-        obj = paginator.page(1).object_list
-    pages = paginator.num_pages
-    if pages in [0, 1]:
-        pages = 1
-    serializer = serializer(instance=obj, context=context, many=True)
-    return {
-        "result": serializer.data,
-        "pages": pages,
-        "page": int(page if str(page).isnumeric() else 1),
-        "total_count": query_count,
-    }
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
 
 
-def user_key_creator(users):
-    if isinstance(users, str):
-        users = json.loads(users)
-    return [
-        {
-            "username": i.get("Username"),
-            "hostname": i.get("Hostname"),
-            "device": i.get("Device"),
-            "remote_ip": i.get("Remote IP"),
-            "user_agent": i.get("User-Agent"),
-            "since": i.get("_Connected at"),
-            "connected_at": i.get("Connected at"),
-            "average_rx": i.get("Average RX"),
-            "average_tx": i.get("Average TX"),
-        }
-        for i in users
-    ]
+def _cursor_page(request, queryset, item_per_page, cached):
+    """
+    keyset pagination on the primary key, every page costs the same as the first one.
+    rows are always ordered by pk, descending when the queryset is ordered by -id/-pk and
+    ascending for any other ordering, so cursors only fit listings ordered by id.
+    """
+    cursor = _positive_int(request.GET.get("cursor"), None)
+    descending = queryset.query.order_by[:1] in (("-id",), ("-pk",))
+    if cached:
+        rows = sorted(queryset._result_cache, key=lambda row: row.pk, reverse=descending)
+        if cursor is not None:
+            rows = [row for row in rows if (row.pk < cursor if descending else row.pk > cursor)]
+        return rows[:item_per_page]
+    if descending:
+        queryset = queryset.order_by("-pk")
+        if cursor is not None:
+            queryset = queryset.filter(pk__lt=cursor)
+    else:
+        queryset = queryset.order_by("pk")
+        if cursor is not None:
+            queryset = queryset.filter(pk__gt=cursor)
+    return list(queryset[:item_per_page])
 
 
-def ip_bans_creator(bans):
-    if isinstance(bans, str) and len(bans) > 2:
-        bans = json.loads(bans)
-        return [
-            {
-                "ip": i.get("IP"),
-                "since": i.get("Since"),
-                "score": i.get("Score"),
-            }
-            for i in bans
-        ]
-    return []
+def pagination(
+    request, queryset, serializer, context=None, include_total=False, only_fields=None
+):
+    if context is None:
+        context = {}
+    item_per_page = _positive_int(request.GET.get("item_per_page"), 100)
+    # prefetched or already evaluated querysets are counted and sliced from their cache
+    cached = queryset._result_cache is not None
+    if not cached and only_fields:
+        queryset = queryset.only(*only_fields)
+    if "cursor" in request.GET:
+        # no count in cursor mode, it would cost a full scan on every page
+        obj = _cursor_page(request, queryset, item_per_page, cached)
+        serializer = serializer(instance=obj, context=context, many=True)
+        return {
+            "result": serializer.data,
+            "next_cursor": obj[-1].pk if len(obj) == item_per_page else None,
+        }
+    page = _positive_int(request.GET.get("page"), 1)
+    query_count = pages = None
+    if include_total:
+        if cached:
+            query_count = len(queryset._result_cache)
+        else:
+            # ordering and joins do not change the number of rows, drop them for the count
+            query_count = queryset.order_by().values("pk").count()
+        pages = max(ceil(query_count / item_per_page), 1)
+        page = min(page, pages)
+        if query_count == 0:
+            return {"result": [], "page": page, "pages": pages, "total_count": 0}
+    if not cached and not queryset.ordered:
+        queryset = queryset.order_by("id")
+    offset = (page - 1) * item_per_page
+    # the slice is evaluated once, the serializer iterates its result cache
+    obj = queryset[offset : offset + item_per_page]
+    # out of range pages are only possible here when the total was not counted
+    if page > 1 and not obj:
+        obj = queryset[:item_per_page]
+    serializer = serializer(instance=obj, context=context, many=True)
+    data = {"result": serializer.data, "page": page}
+    if query_count is not None:
+        data["total_count"] = query_count
+        data["pages"] = pages
+    return data
@@ -26,7 +26,7 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "ocserv.authentication.CachedTokenAuthentication",
     ],
 }
 
@@ -8,3 +8,7 @@ DATABASES = {
         "NAME": BASE_DIR / "db/db_test.sqlite3",
     }
 }
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
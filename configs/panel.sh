@@ -34,6 +34,11 @@ source ${SITE_DIR}/back-end/venv/bin/activate
 pip install -U wheel setuptools
 pip install -r ${SITE_DIR}/back-end/requirements.txt
 pip install uwsgi==2.0.24
+# optional C build of the occtl creators, a stale extension copied from the source tree is removed first
+rm -f ${SITE_DIR}/back-end/ocserv/modules/_creators*.so
+(cd ${SITE_DIR}/back-end && pip install mypy==1.14.1 && mypyc ocserv/modules/_creators.py) ||
+    (rm -f ${SITE_DIR}/back-end/ocserv/modules/_creators*.so && echo "mypyc build failed, using pure python _creators")
+rm -rf ${SITE_DIR}/back-end/build ${SITE_DIR}/back-end/.mypy_cache
 SECRET_KEY=$(openssl rand -base64 '64')
 echo "DEBUG=False" >${SITE_DIR}/back-end/.env
 echo "SECRET_KEY=${SECRET_KEY}" >>${SITE_DIR}/back-end/.env